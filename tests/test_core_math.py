@@ -2,8 +2,15 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 
 import numpy as np
+import pytest
 
-from wtg_shadow_hours.core import Turbine, accumulate_shadow_hours, solar_position_noaa
+from wtg_shadow_hours.core import (
+    Turbine,
+    accumulate_shadow_hours,
+    generate_yearly_timestamps,
+    solar_position_noaa,
+    yearly_solar_position,
+)
 
 
 def test_accumulation_adds_overlap_once_per_timestep():
@@ -24,3 +31,43 @@ def test_solar_position_ranges():
     az, el = solar_position_noaa(times, latitude_deg=45.0, longitude_deg=10.0)
     assert 0.0 <= az[0] <= 360.0
     assert -90.0 <= el[0] <= 90.0
+
+
+def test_accumulation_independent_of_y_axis_order():
+    x = np.linspace(-200.0, 200.0, 41)
+    y_desc = np.linspace(200.0, -200.0, 41)
+    turbines = [Turbine(0.0, 0.0, rotor_diam_m=60.0, hub_height_m=80.0, turbine_id="A")]
+    az = np.array([135.0, 180.0, 225.0])
+    el = np.array([30.0, 45.0, 30.0])
+    desc = accumulate_shadow_hours(x, y_desc, turbines, az, el, timestep_hours=0.25, min_solar_elevation_deg=0.0)
+    asc = accumulate_shadow_hours(x, y_desc[::-1], turbines, az, el, timestep_hours=0.25, min_solar_elevation_deg=0.0)
+    assert np.max(desc) > 0.0
+    np.testing.assert_array_equal(desc, asc[::-1])
+
+
+def test_yearly_solar_position_is_cached_and_matches_direct_computation():
+    az, el = yearly_solar_position(2025, 30, 45.0, 10.0)
+    az_again, el_again = yearly_solar_position(2025, 30, 45.0, 10.0)
+    assert az is az_again and el is el_again
+    assert not az.flags.writeable and not el.flags.writeable
+
+    times = generate_yearly_timestamps(2025, 30)
+    ref_az, ref_el = solar_position_noaa(times, latitude_deg=45.0, longitude_deg=10.0)
+    np.testing.assert_array_equal(az, ref_az)
+    np.testing.assert_array_equal(el, ref_el)
+
+
+def test_accumulation_rejects_non_monotonic_axes():
+    turbines = [Turbine(0.0, 0.0, rotor_diam_m=20.0, hub_height_m=50.0, turbine_id="A")]
+    az = np.array([180.0])
+    el = np.array([45.0])
+    with pytest.raises(ValueError, match="x_coords"):
+        accumulate_shadow_hours(
+            np.array([0.0, 10.0, -10.0]),
+            np.array([10.0, 0.0, -10.0]),
+            turbines,
+            az,
+            el,
+            timestep_hours=0.25,
+            min_solar_elevation_deg=0.0,
+        )
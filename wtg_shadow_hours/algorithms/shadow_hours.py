@@ -5,7 +5,6 @@ from __future__ import annotations
 import os
 
 import numpy as np
-from osgeo import gdal, osr
 from qgis.core import (
     QgsColorRampShader,
     QgsCoordinateReferenceSystem,
@@ -26,7 +25,7 @@ from qgis.core import (
 )
 from qgis.PyQt.QtGui import QColor
 
-from ..core import Turbine, accumulate_shadow_hours, generate_yearly_timestamps, solar_position_noaa
+from ..core import Turbine, accumulate_shadow_hours, yearly_solar_position
 
 
 class ComputeWtgAnnualShadowHoursAlgorithm(QgsProcessingAlgorithm):
@@ -159,11 +158,12 @@ class ComputeWtgAnnualShadowHoursAlgorithm(QgsProcessingAlgorithm):
         y_center = (ymin + ymax) * 0.5
         center_ll = QgsCoordinateTransform(src_crs, QgsCoordinateReferenceSystem("EPSG:4326"), QgsProject.instance()).transform(x_center, y_center)
 
-        times = generate_yearly_timestamps(year, timestep_minutes, timezone="Europe/Rome")
-        azimuth_deg, elevation_deg = solar_position_noaa(times, center_ll.y(), center_ll.x())
+        azimuth_deg, elevation_deg = yearly_solar_position(
+            year, timestep_minutes, center_ll.y(), center_ll.x(), timezone="Europe/Rome"
+        )
 
         timestep_hours = timestep_minutes / 60.0
-        feedback.pushInfo(f"Computing {len(times)} timesteps on grid {n_cols}x{n_rows}.")
+        feedback.pushInfo(f"Computing {azimuth_deg.size} timesteps on grid {n_cols}x{n_rows}.")
         shadow_hours = accumulate_shadow_hours(
             x_coords=x_coords,
             y_coords=y_coords,
@@ -182,6 +182,8 @@ class ComputeWtgAnnualShadowHoursAlgorithm(QgsProcessingAlgorithm):
         return ComputeWtgAnnualShadowHoursAlgorithm()
 
     def _write_raster(self, path, array, xmin, ymax, cellsize, crs):
+        from osgeo import gdal, osr
+
         tif_path = path if os.path.splitext(path)[1].lower() != ".asc" else os.path.splitext(path)[0] + ".tif"
         driver = gdal.GetDriverByName("GTiff")
         dataset = driver.Create(tif_path, array.shape[1], array.shape[0], 1, gdal.GDT_Float32)
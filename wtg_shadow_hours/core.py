@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from math import pi
 from zoneinfo import ZoneInfo
 
@@ -74,6 +75,116 @@ def solar_position_noaa(times, latitude_deg: float, longitude_deg: float):
     return azimuth_deg, elevation_deg
 
 
+@lru_cache(maxsize=8)
+def yearly_solar_position(
+    year: int,
+    timestep_minutes: int,
+    latitude_deg: float,
+    longitude_deg: float,
+    timezone: str = "Europe/Rome",
+):
+    """Cached solar azimuth/elevation for a full year of timesteps.
+
+    Returned arrays are shared between calls and therefore read-only.
+    """
+    times = generate_yearly_timestamps(year, timestep_minutes, timezone=timezone)
+    azimuth_deg, elevation_deg = solar_position_noaa(times, latitude_deg, longitude_deg)
+    azimuth_deg.setflags(write=False)
+    elevation_deg.setflags(write=False)
+    return azimuth_deg, elevation_deg
+
+
+def _axis_index_ranges(coords: np.ndarray, lower: np.ndarray, upper: np.ndarray):
+    """Return ``[start, stop)`` index ranges of monotonic ``coords`` within ``[lower, upper]``."""
+    coords = np.asarray(coords, dtype=float)
+    if coords.size > 1 and coords[0] > coords[-1]:
+        rev = coords[::-1]
+        start = coords.size - np.searchsorted(rev, upper, side="right")
+        stop = coords.size - np.searchsorted(rev, lower, side="left")
+    else:
+        start = np.searchsorted(coords, lower, side="left")
+        stop = np.searchsorted(coords, upper, side="right")
+    return start, stop
+
+
+# Upper bound on (timestep, turbine) pairs whose ellipse parameters are held in memory at once.
+_BLOCK_PAIRS = 65536
+
+
+def _count_shadow_block(x_coords, y_coords, tx, ty, radius, models, model_idx, el_rad, az_rad):
+    """Count shadowed timesteps per cell for one block of timesteps.
+
+    Returns ``(row_offset, col_offset, counts)`` with ``counts`` covering only the block's
+    footprint on the grid, or ``None`` when no ellipse of the block touches the grid.
+    """
+    el_rad = el_rad[:, None]
+    az_rad = az_rad[:, None]
+
+    # Turbine-independent factors, evaluated once per timestep.
+    sin_el = np.sin(el_rad)
+    tan_el = np.tan(el_rad)
+    sin_az = np.sin(az_rad)
+    cos_az = np.cos(az_rad)
+
+    # Ellipse parameters for every (timestep, turbine) pair of the block, shape (T, N).
+    # Shadow length and major axis only depend on the turbine model (hub height, rotor radius).
+    d = (models[:, 0] / tan_el)[:, model_idx]
+    a = (models[:, 1] / sin_el)[:, model_idx]
+    b = np.broadcast_to(radius, a.shape)
+    center_x = tx - d * sin_az
+    center_y = ty - d * cos_az
+    # Major axis points along the sun azimuth: theta = 90 - az, so cos(theta) = sin(az), sin(theta) = cos(az).
+    cos_t = np.broadcast_to(sin_az, a.shape)
+    sin_t = np.broadcast_to(cos_az, a.shape)
+
+    inv_a2 = 1.0 / (a * a)
+    inv_b2 = 1.0 / (b * b)
+
+    x_extent = np.abs(a * cos_t) + np.abs(b * sin_t)
+    y_extent = np.abs(a * sin_t) + np.abs(b * cos_t)
+    col_start, col_stop = _axis_index_ranges(x_coords, center_x - x_extent, center_x + x_extent)
+    row_start, row_stop = _axis_index_ranges(y_coords, center_y - y_extent, center_y + y_extent)
+    del d, a, x_extent, y_extent
+
+    # Bounding-box prefilter: only pairs whose ellipse box overlaps the grid are evaluated.
+    keep = (col_start < col_stop) & (row_start < row_stop)
+    if not keep.any():
+        return None
+
+    # Per-timestep window covering every kept ellipse, so each step only touches its own footprint.
+    step_row_start = np.where(keep, row_start, y_coords.size).min(axis=1)
+    step_row_stop = np.where(keep, row_stop, 0).max(axis=1)
+    step_col_start = np.where(keep, col_start, x_coords.size).min(axis=1)
+    step_col_stop = np.where(keep, col_stop, 0).max(axis=1)
+
+    active_steps = np.flatnonzero(keep.any(axis=1))
+    br0, br1 = step_row_start[active_steps].min(), step_row_stop[active_steps].max()
+    bc0, bc1 = step_col_start[active_steps].min(), step_col_stop[active_steps].max()
+    counts = np.zeros((br1 - br0, bc1 - bc0), dtype=np.int32)
+
+    for t in active_steps:
+        wr0, wr1 = step_row_start[t], step_row_stop[t]
+        wc0, wc1 = step_col_start[t], step_col_stop[t]
+        step_mask = np.zeros((wr1 - wr0, wc1 - wc0), dtype=bool)
+
+        for n in np.flatnonzero(keep[t]):
+            c0, c1 = col_start[t, n], col_stop[t, n]
+            r0, r1 = row_start[t, n], row_stop[t, n]
+
+            # The grid is separable, so rotate row and column offsets independently and broadcast.
+            sub_x = x_coords[c0:c1] - center_x[t, n]
+            sub_y = (y_coords[r0:r1] - center_y[t, n])[:, None]
+
+            xr = sub_x * cos_t[t, n] + sub_y * sin_t[t, n]
+            yr = sub_y * cos_t[t, n] - sub_x * sin_t[t, n]
+            in_ellipse = xr * xr * inv_a2[t, n] + yr * yr * inv_b2[t, n] <= 1.0
+            step_mask[r0 - wr0 : r1 - wr0, c0 - wc0 : c1 - wc0] |= in_ellipse
+
+        counts[wr0 - br0 : wr1 - br0, wc0 - bc0 : wc1 - bc0] += step_mask
+
+    return br0, bc0, counts
+
+
 def accumulate_shadow_hours(
     x_coords: np.ndarray,
     y_coords: np.ndarray,
@@ -83,50 +194,45 @@ def accumulate_shadow_hours(
     timestep_hours: float,
     min_solar_elevation_deg: float,
 ):
-    xx, yy = np.meshgrid(x_coords, y_coords)
-    out = np.zeros_like(xx, dtype=np.float32)
-
+    """Accumulate shadow hours per grid cell, counting overlapping turbines once per timestep.
+
+    ``x_coords`` and ``y_coords`` are the cell-centre axes of the grid and must each be
+    monotonic (ascending or descending); a ``ValueError`` is raised otherwise.
+    """
+    x_coords = np.asarray(x_coords, dtype=float)
+    y_coords = np.asarray(y_coords, dtype=float)
+    for name, coords in (("x_coords", x_coords), ("y_coords", y_coords)):
+        steps = np.diff(coords)
+        if not (np.all(steps >= 0.0) or np.all(steps <= 0.0)):
+            raise ValueError(f"{name} must be monotonic.")
+    out = np.zeros((y_coords.size, x_coords.size), dtype=np.float32)
+
+    azimuth_deg = np.asarray(azimuth_deg, dtype=float)
+    elevation_deg = np.asarray(elevation_deg, dtype=float)
     valid = elevation_deg > max(0.0, float(min_solar_elevation_deg))
-    for az, el in zip(azimuth_deg[valid], elevation_deg[valid]):
-        el_rad = np.deg2rad(el)
-        sin_el = np.sin(el_rad)
-        tan_el = np.tan(el_rad)
-        step_mask = np.zeros_like(out, dtype=bool)
-
-        for turbine in turbines:
-            radius = turbine.rotor_diam_m * 0.5
-            d = turbine.hub_height_m / tan_el
-            a = radius / sin_el
-            b = radius
-            az_rad = np.deg2rad(az)
-
-            center_x = turbine.x - d * np.sin(az_rad)
-            center_y = turbine.y - d * np.cos(az_rad)
-            theta = np.deg2rad(90.0 - az)
-
-            cos_t = np.cos(theta)
-            sin_t = np.sin(theta)
-            x_extent = abs(a * cos_t) + abs(b * sin_t)
-            y_extent = abs(a * sin_t) + abs(b * cos_t)
-
-            x_min = center_x - x_extent
-            x_max = center_x + x_extent
-            y_min = center_y - y_extent
-            y_max = center_y + y_extent
-
-            cols = np.where((x_coords >= x_min) & (x_coords <= x_max))[0]
-            rows = np.where((y_coords >= y_min) & (y_coords <= y_max))[0]
-            if cols.size == 0 or rows.size == 0:
-                continue
-
-            sub_x = xx[np.ix_(rows, cols)] - center_x
-            sub_y = yy[np.ix_(rows, cols)] - center_y
-
-            xr = sub_x * cos_t + sub_y * sin_t
-            yr = -sub_x * sin_t + sub_y * cos_t
-            in_ellipse = (xr / a) ** 2 + (yr / b) ** 2 <= 1.0
-            step_mask[np.ix_(rows, cols)] |= in_ellipse
-
-        out[step_mask] += timestep_hours
-
+    if not turbines or not np.any(valid):
+        return out
+
+    el_rad = np.deg2rad(elevation_deg[valid])
+    az_rad = np.deg2rad(azimuth_deg[valid])
+    tx = np.array([t.x for t in turbines], dtype=float)
+    ty = np.array([t.y for t in turbines], dtype=float)
+    radius = np.array([t.rotor_diam_m for t in turbines], dtype=float) * 0.5
+    hub = np.array([t.hub_height_m for t in turbines], dtype=float)
+    models, model_idx = np.unique(np.column_stack((hub, radius)), axis=0, return_inverse=True)
+    model_idx = model_idx.ravel()
+
+    # Ellipse parameters are built one block of timesteps at a time to bound memory.
+    block_steps = max(1, _BLOCK_PAIRS // len(turbines))
+
+    # Integer counts avoid float32 drift from repeatedly adding non-dyadic timesteps.
+    counts = np.zeros(out.shape, dtype=np.int32)
+    for start in range(0, el_rad.size, block_steps):
+        block = slice(start, start + block_steps)
+        result = _count_shadow_block(x_coords, y_coords, tx, ty, radius, models, model_idx, el_rad[block], az_rad[block])
+        if result is not None:
+            r0, c0, block_counts = result
+            counts[r0 : r0 + block_counts.shape[0], c0 : c0 + block_counts.shape[1]] += block_counts
+
+    out += counts * np.float32(timestep_hours)
     return out
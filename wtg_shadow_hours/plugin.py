@@ -1,7 +1,5 @@
 """Plugin bootstrap wiring for QGIS."""
 
-from .processing_provider import WtgShadowProcessingProvider
-
 
 class WtgShadowHoursPlugin:
     def __init__(self, iface):
@@ -9,9 +7,12 @@ class WtgShadowHoursPlugin:
         self.provider = None
 
     def initGui(self):
-        self.provider = WtgShadowProcessingProvider()
         from qgis.core import QgsApplication
 
+        from .processing_provider import WtgShadowProcessingProvider
+
+        self.provider = WtgShadowProcessingProvider()
+
         QgsApplication.processingRegistry().addProvider(self.provider)
 
     def unload(self):